@@ -6,7 +6,7 @@
 import asyncio
 import logging
 import threading
-from typing import Pattern, Dict, Any, Callable, Optional
+from typing import Pattern, Dict, Any, Callable, List, Optional
 
 from bleak import BleakScanner, BleakClient
 from bleak.backends.device import BLEDevice as BleakDevice
@@ -248,32 +248,29 @@ class BleakWrapperController(BLEController[BleakDevice, BleakClient], Singleton)
             for service in handle.services:
                 logger.debug(f"[Service] {service.uuid}: {service.description}")
                 try:
-                    # Create new service
-                    services[UUID(service.uuid)] = Service(UUID(service.uuid), service.description)
+                    service_uuid = UUID(service.uuid)
                 except ValueError:
                     logger.error(f"{service.uuid} is not a known service")
                     continue
+                # Create new service. Its char dict is filled in below.
+                chars: Dict[UUID, Characteristic] = {}
+                services[service_uuid] = Service(service_uuid, service.description, chars)
 
                 # Loop over all chars in service
-                chars: Dict[UUID, Characteristic] = {}
                 for char in service.characteristics:
                     # Read if applicable
                     value = bytes(await handle.read_gatt_char(char.uuid)) if "read" in char.properties else b""
-                    # Create and log characteristic
-                    c = Characteristic(char.handle, UUID(char.uuid), char.properties, char.description, value)
                     # Get any descriptors if they exist
-                    descriptors = []
+                    descriptors: List[Descriptor] = []
                     for descriptor in char.descriptors:
-                        value = await handle.read_gatt_descriptor(descriptor.handle)
-                        descriptors.append(Descriptor(descriptor.handle, value))
-                    # Update char and add to dict
-                    c.descriptors = descriptors
-                    # Add characteristic to char dic
+                        descriptor_value = await handle.read_gatt_descriptor(descriptor.handle)
+                        descriptors.append(Descriptor(descriptor.handle, descriptor_value))
+                    # Create characteristic and add to char dict
+                    c = Characteristic(
+                        char.handle, UUID(char.uuid), char.properties, char.description, value, descriptors
+                    )
                     chars[c.uuid] = c
 
-                # Add char dict to service
-                services[UUID(service.uuid)].chars = chars
-
             logger.info("Done discovering characteristics!")
             return AttributeTable(services)
 
@@ -7,7 +7,7 @@ import re
 import csv
 import logging
 from pathlib import Path
-from typing import Generic, Optional, Union, Pattern
+from typing import Any, Generic, List, Optional, Tuple, Union, Pattern
 
 from open_gopro.exceptions import FailedToFindDevice, ConnectFailed
 from .controller import (
@@ -177,16 +177,18 @@ class BleClient(Generic[BleHandle, BleDevice]):
             dump_file (Path, optional): Where to dump the csv. Defaults to Path("services.csv").
         """
         assert self.gatt_table is not None
-        with open(dump_file, mode="w") as f:
+        # Build all of the rows first so they can be written in one pass
+        rows: List[Tuple[Any, ...]] = [("handle", "description", "UUID", "properties", "value")]
+        # For each service in table
+        for s in self.gatt_table.services.values():
+            rows.append(("SERVICE", s.name, s.uuid.value, "SERVICE", "SERVICE"))
+            # For each characteristic in service
+            for c in s.chars.values():
+                rows.append((c.handle, c.name, c.uuid.value, " ".join(c.props), c.value))
+                # For each descriptor in characteristic
+                rows.extend((d.handle, "DESCRIPTOR", "", "", d.value) for d in c.descriptors)
+
+        with open(dump_file, mode="w", newline="") as f:
             logger.debug(f"Dumping discovered BLE characteristics to {dump_file}")
             w = csv.writer(f, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
-            w.writerow(["handle", "description", "UUID", "properties", "value"])
-            # For each service in table
-            for s in self.gatt_table.services.values():
-                w.writerow(["SERVICE", s.name, s.uuid.value, "SERVICE", "SERVICE"])
-                # For each characteristic in service
-                for c in s.chars.values():
-                    w.writerow([c.handle, c.name, c.uuid.value, " ".join(c.props), c.value])
-                    # For each descriptor in characteristic
-                    for d in c.descriptors:
-                        w.writerow([d.handle, "DESCRIPTOR", "", "", d.value])
+            w.writerows(rows)
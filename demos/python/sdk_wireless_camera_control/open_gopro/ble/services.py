@@ -5,8 +5,11 @@
 
 import json
 import enum
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Union
+import uuid as _uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+from open_gopro.util import add_slots
 
 
 GOPRO_BASE_UUID = "b5f9{}-aa8d-11e3-9046-0002a5d5c51b"
@@ -77,6 +80,33 @@ class UUID(enum.Enum):
     INTERNAL_83 = GOPRO_BASE_UUID.format("0083")
     INTERNAL_84 = GOPRO_BASE_UUID.format("0084")
 
+    # Members are singletons compared by identity so use the C-level identity hash rather than Enum's
+    # Python-level hash of the member name. UUIDs are dict keys on every received notification.
+    __hash__ = object.__hash__
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["UUID"]:
+        """Fall back to parsing non-canonical UUID strings (upper case, no dashes, braces, etc).
+
+        The exact-value lookup is handled by Enum itself. This is only reached when it fails.
+
+        Args:
+            value (object): value that did not directly match a member
+
+        Returns:
+            Optional[UUID]: the matching member if the parsed UUID is known, otherwise None
+        """
+        if not isinstance(value, str):
+            return None
+        # Differing case is the common deviation so try a single lower() pass before fully parsing
+        member = cls._value2member_map_.get(value.lower())
+        if member is None:
+            try:
+                member = cls._value2member_map_.get(str(_uuid.UUID(value)))
+            except ValueError:
+                return None
+        return cast(Optional["UUID"], member)
+
 
 def get_gopro_desc(uuid: str) -> Union[UUID, str]:
     """Attempt to retrieve a the name of a UUID from it's value.
@@ -88,11 +118,12 @@ def get_gopro_desc(uuid: str) -> Union[UUID, str]:
         Union[UUID, str]: a UUID object if success, otherwise just the input string
     """
     try:
-        return UUID(uuid.lower()).name
+        return UUID(uuid).name
     except ValueError:
         return uuid
 
 
+@add_slots
 @dataclass
 class Descriptor:
     """A charactersistic descriptor.
@@ -106,9 +137,18 @@ class Descriptor:
     value: bytes
 
     def __str__(self) -> str:  # pylint: disable=missing-return-doc
-        return json.dumps(asdict(self), indent=4, default=str)
+        return json.dumps(self._as_dict(), indent=4, default=str)
 
+    def _as_dict(self) -> Dict[str, Any]:
+        """Get the fields as a dict to be serialized.
 
+        Returns:
+            Dict[str, Any]: field names mapped to values
+        """
+        return {"handle": self.handle, "value": self.value}
+
+
+@add_slots
 @dataclass
 class Characteristic:
     """A BLE charactersistic.
@@ -130,9 +170,21 @@ class Characteristic:
     descriptors: List[Descriptor] = field(default_factory=list)
 
     def __str__(self) -> str:  # pylint: disable=missing-return-doc
-        return json.dumps(asdict(self), indent=4, default=str)
-
-
+        return json.dumps(
+            {
+                "handle": self.handle,
+                "uuid": self.uuid,
+                "props": self.props,
+                "name": self.name,
+                "value": self.value,
+                "descriptors": [d._as_dict() for d in self.descriptors],
+            },
+            indent=4,
+            default=str,
+        )
+
+
+@add_slots
 @dataclass
 class Service:
     """A BLE service or grouping of Characteristics.
@@ -156,7 +208,56 @@ class AttributeTable:
     """
 
     def __init__(self, services: Dict[UUID, Service]) -> None:
-        self.services = services
+        self._services = services
+        # handle --> (service key, characteristic key) of the characteristic at that handle
+        self._handle2keys: Dict[int, Tuple[Any, Any]] = {}
+        self._index_handles()
+
+    @property
+    def services(self) -> Dict[UUID, Service]:
+        """The services in the table, indexed by UUID.
+
+        Returns:
+            Dict[UUID, Service]: services dictionary
+        """
+        return self._services
+
+    @services.setter
+    def services(self, services: Dict[UUID, Service]) -> None:
+        """Set the services and rebuild the handle lookup table.
+
+        Args:
+            services (Dict[UUID, Service]): services dictionary
+        """
+        self._services = services
+        self._index_handles()
+
+    def _index_handles(self) -> None:
+        """Rebuild the handle lookup table from the current services.
+
+        If multiple characteristics share a handle, the first one found is used.
+        """
+        self._handle2keys = {}
+        for service_key, service in self._services.items():
+            for char_key, char in service.chars.items():
+                self._handle2keys.setdefault(char.handle, (service_key, char_key))
+
+    def _indexed_char(self, handle: int) -> Optional[Characteristic]:
+        """Get the indexed characteristic at a handle if it is still in place in the services.
+
+        Args:
+            handle (int): the handle to search for
+
+        Returns:
+            Optional[Characteristic]: the characteristic if the index entry is valid, otherwise None
+        """
+        try:
+            service_key, char_key = self._handle2keys[handle]
+        except KeyError:
+            return None
+        service = self._services.get(service_key)
+        char = service.chars.get(char_key) if service is not None else None
+        return char if char is not None and char.handle == handle else None
 
     def handle2uuid(self, handle: int) -> UUID:
         """Get a UUID from a handle.
@@ -170,8 +271,11 @@ class AttributeTable:
         Returns:
             UUID: The found UUID
         """
-        for s in self.services.values():
-            for c in s.chars.values():
-                if c.handle == handle:
-                    return c.uuid
-        raise Exception(f"Matching UUID not found for handle {handle}")
+        char = self._indexed_char(handle)
+        if char is None:
+            # The services and their chars are mutable dicts so the index may be stale after an in-place change
+            self._index_handles()
+            char = self._indexed_char(handle)
+        if char is None:
+            raise Exception(f"Matching UUID not found for handle {handle}")
+        return char.uuid
@@ -26,7 +26,11 @@ class GoProEnumMeta(EnumMeta):
         Returns:
             Iterator[T]: enum iterator
         """
-        return iter([x[1] for x in cls._member_map_.items() if x[0] not in GoProEnumMeta.ITER_SKIP_NAMES])  # type: ignore
+        return (
+            member
+            for name, member in cls._member_map_.items()  # type: ignore
+            if name not in GoProEnumMeta.ITER_SKIP_NAMES
+        )
 
 
 class GoProEnum(Enum, metaclass=GoProEnumMeta):
@@ -193,6 +197,36 @@ class QueryCmdId(GoProEnum):
     INVALID_FOR_TESTING = 0xFF
 
 
+# Query commands whose response parameters are identified by SettingId
+SETTING_QUERY_CMDS = (
+    QueryCmdId.GET_SETTING_VAL,
+    QueryCmdId.REG_SETTING_VAL_UPDATE,
+    QueryCmdId.UNREG_SETTING_VAL_UPDATE,
+    QueryCmdId.SETTING_VAL_PUSH,
+    QueryCmdId.SETTING_CAPABILITY_PUSH,
+    QueryCmdId.GET_CAPABILITIES_VAL,
+    QueryCmdId.REG_CAPABILITIES_UPDATE,
+    QueryCmdId.UNREG_CAPABILITIES_UPDATE,
+)
+
+# Query commands whose responses carry status values
+STATUS_VALUE_QUERY_CMDS = (
+    QueryCmdId.GET_STATUS_VAL,
+    QueryCmdId.REG_STATUS_VAL_UPDATE,
+    QueryCmdId.STATUS_VAL_PUSH,
+)
+
+# Query commands whose response parameters are identified by StatusId
+STATUS_QUERY_CMDS = (*STATUS_VALUE_QUERY_CMDS, QueryCmdId.UNREG_STATUS_VAL_UPDATE)
+
+# Query commands whose response parameters can each contain more than one value
+CAPABILITY_QUERY_CMDS = (
+    QueryCmdId.GET_CAPABILITIES_VAL,
+    QueryCmdId.REG_CAPABILITIES_UPDATE,
+    QueryCmdId.SETTING_CAPABILITY_PUSH,
+)
+
+
 class StatusId(GoProEnum):
     """Status ID to identify statuses sent to UUID.CQ_QUERY or received from UUID.CQ_QUERY_RESP."""
 
@@ -24,7 +24,7 @@ from open_gopro.wifi import WifiController
 from open_gopro.wifi.adapters import Wireless
 from open_gopro.util import SnapshotQueue
 from open_gopro.responses import GoProResp
-from open_gopro.constants import CmdId, ErrorCode, StatusId, QueryCmdId, ProducerType
+from open_gopro.constants import CmdId, ErrorCode, StatusId, ProducerType, STATUS_VALUE_QUERY_CMDS
 from open_gopro.api import (
     Api,
     api_versions,
@@ -495,30 +495,14 @@ class GoPro(GoProBle, GoProWifi, Generic[BleDevice]):
 
             # Handle internal statuses
             if self._maintain_ble:
-                if (
-                    response.cmd
-                    in [
-                        QueryCmdId.REG_STATUS_VAL_UPDATE,
-                        QueryCmdId.GET_STATUS_VAL,
-                        QueryCmdId.STATUS_VAL_PUSH,
-                    ]
-                    and StatusId.ENCODING in response.data
-                ):
+                if response.cmd in STATUS_VALUE_QUERY_CMDS and StatusId.ENCODING in response.data:
                     with self._state_condition:
                         if response[StatusId.ENCODING] is True:
                             self._internal_state |= GoPro._InternalState.ENCODING
                         else:
                             self._internal_state &= ~GoPro._InternalState.ENCODING
                         self._state_condition.notify()
-                if (
-                    response.cmd
-                    in [
-                        QueryCmdId.REG_STATUS_VAL_UPDATE,
-                        QueryCmdId.GET_STATUS_VAL,
-                        QueryCmdId.STATUS_VAL_PUSH,
-                    ]
-                    and StatusId.SYSTEM_READY in response.data
-                ):
+                if response.cmd in STATUS_VALUE_QUERY_CMDS and StatusId.SYSTEM_READY in response.data:
                     with self._state_condition:
                         if response[StatusId.SYSTEM_READY] is True:
                             self._internal_state &= ~GoPro._InternalState.SYSTEM_BUSY
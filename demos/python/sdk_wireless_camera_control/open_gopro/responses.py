@@ -36,6 +36,9 @@ from open_gopro.constants import (
     QueryCmdId,
     ResponseType,
     CmdType,
+    SETTING_QUERY_CMDS,
+    STATUS_QUERY_CMDS,
+    CAPABILITY_QUERY_CMDS,
 )
 from open_gopro.util import scrub
 from open_gopro.ble import UUID
@@ -425,34 +428,22 @@ class GoProResp:
         # Is this a BLE response?
         if isinstance(self._raw_packet, bytearray):
             buf: bytearray = self._raw_packet
+            # The uuid property searches the info list so only look it up once
+            uuid = self.uuid
 
             # UUID's whose responses contain multiple parameters to parse
-            if self.uuid in [UUID.CQ_QUERY_RESP, UUID.CQ_SETTINGS_RESP]:
+            if uuid in (UUID.CQ_QUERY_RESP, UUID.CQ_SETTINGS_RESP):
                 identifier: Optional[Type[ResponseType]] = None
-                if self.uuid is UUID.CQ_SETTINGS_RESP:
+                if uuid is UUID.CQ_SETTINGS_RESP:
                     self._info.append(SettingId(buf[0]))
                     identifier = SettingId
                 else:
                     self._info.append(QueryCmdId(buf[0]))
-                    if self.id in [
-                        QueryCmdId.GET_SETTING_VAL,
-                        QueryCmdId.REG_SETTING_VAL_UPDATE,
-                        QueryCmdId.UNREG_SETTING_VAL_UPDATE,
-                        QueryCmdId.SETTING_VAL_PUSH,
-                        QueryCmdId.SETTING_CAPABILITY_PUSH,
-                        QueryCmdId.GET_CAPABILITIES_VAL,
-                        QueryCmdId.REG_CAPABILITIES_UPDATE,
-                        QueryCmdId.UNREG_CAPABILITIES_UPDATE,
-                    ]:
+                    if self.id in SETTING_QUERY_CMDS:
                         identifier = SettingId
                     elif self.id is QueryCmdId.GET_SETTING_NAME:
                         raise NotImplementedError
-                    elif self.id in [
-                        QueryCmdId.GET_STATUS_VAL,
-                        QueryCmdId.REG_STATUS_VAL_UPDATE,
-                        QueryCmdId.UNREG_STATUS_VAL_UPDATE,
-                        QueryCmdId.STATUS_VAL_PUSH,
-                    ]:
+                    elif self.id in STATUS_QUERY_CMDS:
                         identifier = StatusId
                     else:
                         raise Exception("Unhandled parse state")
@@ -460,6 +451,8 @@ class GoProResp:
                 # Parse all parameters
                 self.status = ErrorCode(buf[1])
                 buf = buf[2:]
+                # The cmd property searches the info list so only look it up once
+                cmd = self.cmd
                 while len(buf) != 0:
                     param_id = identifier(buf[0])
                     param_len = buf[1]
@@ -475,11 +468,7 @@ class GoProResp:
                     # Add parsed value to response's data dict
                     try:
                         # These can be more than 1 value so use a list
-                        if self.cmd in [
-                            QueryCmdId.GET_CAPABILITIES_VAL,
-                            QueryCmdId.REG_CAPABILITIES_UPDATE,
-                            QueryCmdId.SETTING_CAPABILITY_PUSH,
-                        ]:
+                        if cmd in CAPABILITY_QUERY_CMDS:
                             # Parse using parser from map and append
                             # Mypy can't follow that this parser is guarantted to be a ByteParser
                             self.data[param_id].append(self._parsers[param_id].parse(param_val))  # type: ignore
@@ -499,7 +488,7 @@ class GoProResp:
                         self.data[param_id] = param_val
 
             else:  # Other UUID's have responses that can be parsed monolithically
-                if self.uuid is UUID.CQ_COMMAND_RESP:
+                if uuid is UUID.CQ_COMMAND_RESP:
                     self._info.append(CmdId(buf[0]))
                     # If this is a protobuf, first get the action ID (after stripping msb)
                     assert self.cmd is not None
@@ -8,13 +8,16 @@ import queue
 import logging
 import subprocess
 from pathlib import Path
-from typing import Dict, Type, Any, List, Optional, Union
+from dataclasses import fields
+from typing import Dict, Type, Any, List, Optional, Union, TypeVar
 
 from rich.logging import RichHandler
 from rich import traceback
 
 util_logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def setup_logging(logger: Any, output: Path, modules: Dict[str, int] = None) -> Any:
     """Configure open gopro modules for logging
@@ -183,6 +186,30 @@ class Singleton:
         return cls._instances[cls]
 
 
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Recreate a dataclass so that its fields are stored in __slots__ instead of a per-instance __dict__.
+
+    This is a stand-in for @dataclass(slots=True) which is only available in Python >= 3.10. It must be
+    applied on top of (i.e. after) the @dataclass decorator.
+
+    Args:
+        cls (Type[T]): dataclass to recreate
+
+    Returns:
+        Type[T]: new class with the same fields, methods, and defaults, but slotted
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore
+    cls_dict["__slots__"] = field_names
+    # Class-level field defaults would conflict with the slot descriptors. The generated __init__ already
+    # captured them so they are safe to drop.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)  # type: ignore
+
+
 class SnapshotQueue(queue.Queue):
     """A subclass of the default queue module to safely take a snapshot of the queue
 
@@ -3,8 +3,12 @@
 
 # pylint: disable = redefined-outer-name
 
+import csv
+from pathlib import Path
 from typing import List, Dict
 
+import pytest
+
 from open_gopro.constants import UUID
 from open_gopro.ble import Descriptor, Characteristic, Service, AttributeTable, BleClient
 
@@ -30,6 +34,57 @@ def test_handle2uuid(attribute_table: AttributeTable):
     assert attribute_table.handle2uuid(0xABCD) is UUID.CQ_QUERY
 
 
-def test_services_to_csv(attribute_table: AttributeTable, ble_client: BleClient):
+def test_handle2uuid_not_found(attribute_table: AttributeTable):
+    with pytest.raises(Exception, match="Matching UUID not found"):
+        attribute_table.handle2uuid(0x1234)
+
+
+def test_handle2uuid_after_add(attribute_table: AttributeTable):
+    char = Characteristic(0x1234, UUID.CQ_COMMAND, ["writeable"], "test_added_char", bytes())
+    attribute_table.services[UUID.S_CONTROL_QUERY].chars[UUID.CQ_COMMAND] = char
+    assert attribute_table.handle2uuid(0x1234) is UUID.CQ_COMMAND
+
+
+def test_handle2uuid_after_replace(attribute_table: AttributeTable):
+    chars = attribute_table.services[UUID.S_CONTROL_QUERY].chars
+    for key in chars:
+        chars[key] = Characteristic(0x1234, UUID.CQ_COMMAND, ["writeable"], "test_replaced_char", bytes())
+    assert attribute_table.handle2uuid(0x1234) is UUID.CQ_COMMAND
+    with pytest.raises(Exception, match="Matching UUID not found"):
+        attribute_table.handle2uuid(0xABCD)
+
+
+def test_handle2uuid_after_delete(attribute_table: AttributeTable):
+    attribute_table.services[UUID.S_CONTROL_QUERY].chars.clear()
+    with pytest.raises(Exception, match="Matching UUID not found"):
+        attribute_table.handle2uuid(0xABCD)
+
+
+def test_services_to_csv(attribute_table: AttributeTable, ble_client: BleClient, tmp_path: Path):
     ble_client._gatt_table = attribute_table
-    ble_client.services_as_csv()
+    dump_file = tmp_path / "services.csv"
+    ble_client.services_as_csv(dump_file)
+    with open(dump_file, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["handle", "description", "UUID", "properties", "value"]
+    assert rows[1] == ["SERVICE", "test_service", UUID.S_CONTROL_QUERY.value, "SERVICE", "SERVICE"]
+    assert rows[2] == [
+        str(0xABCD),
+        "test_characteristic",
+        UUID.CQ_QUERY.value,
+        "readable writeable",
+        str(bytes([1, 2, 3, 4])),
+    ]
+    assert rows[3] == [str(0xABCD), "DESCRIPTOR", "", "", str(bytes([1, 2, 3, 4]))]
+    # 2 services, each with 2 characteristics, each with 2 descriptors
+    assert len(rows) == 1 + 2 * (1 + 2 * (1 + 2))
+
+
+def test_uuid_from_non_canonical_string():
+    assert UUID("B5F90076-AA8D-11E3-9046-0002A5D5C51B") is UUID.CQ_QUERY
+    assert UUID("b5f90076aa8d11e390460002a5d5c51b") is UUID.CQ_QUERY
+
+
+def test_attributes_are_slotted(descriptor: Descriptor, characteristic: Characteristic, service: Service):
+    for attribute in (descriptor, characteristic, service):
+        assert not hasattr(attribute, "__dict__")